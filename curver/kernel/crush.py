@@ -33,8 +33,7 @@ class Crush(Move):
         a = self.curve.parallel()
         _, b, e = self.source_triangulation.corner_lookup[a]
         
-        v = self.curve.triangulation.vertex_lookup[a]  # = self.triangulation.vertex_lookup[~a].
-        v_edges = curver.kernel.utilities.cyclic_slice(v, a, ~a)  # The set of edges that come out of v from a round to ~a.
+        v_edges = self.curve.triangulation.fan(a)  # The set of edges that come out of v from a round to ~a.
         around_v = curver.kernel.utilities.maximin([0], (lamination.left_weight(edgy) for edgy in v_edges))
         out_v = sum(max(-lamination.left_weight(edge), 0) for edge in v_edges) + sum(max(-lamination(edge), 0) for edge in v_edges[1:])
         # around_v > 0 ==> out_v == 0; out_v > 0 ==> around_v == 0.
@@ -62,6 +62,7 @@ class MultiCurve(IntegralLamination):
         
         return next(iter(self.vertex_cycles()))
     
+    @memoize
     def crush(self):
         ''' Return the crush map associated to this MultiCurve. '''
         
@@ -128,6 +129,10 @@ class Curve(MultiCurve):
         return edge
     
     def is_short(self):
+        # Peripheral curves and curves parallel to an edge meet each edge at most twice.
+        if max(self.geometric) > 2:
+            return False
+        
         return self.is_peripheral() or len(self.parallel_components()) == 1
     
     def slope(self, lamination):
@@ -148,9 +153,7 @@ class Curve(MultiCurve):
         
         # Get some edges.
         a = short.parallel()
-        v = short.triangulation.vertex_lookup[a]  # = short.triangulation.vertex_lookup[~a].
-        
-        v_edges = curver.kernel.utilities.cyclic_slice(v, a, ~a)  # The set of edges that come out of v from a round to ~a.
+        v_edges = short.triangulation.fan(a)  # The set of edges that come out of v from a round to ~a.
         around_v = curver.kernel.utilities.maximin([0], (short_lamination.left_weight(edgy) for edgy in v_edges))
         out_v = sum(max(-short_lamination.left_weight(edge), 0) for edge in v_edges) + sum(max(-short_lamination(edge), 0) for edge in v_edges[1:])
         
@@ -189,6 +192,7 @@ class Curve(MultiCurve):
         
         return Fraction(f_lower - f_upper, 2*ab*ac)  # No division by zero thanks to our previous checks.
     
+    @memoize
     def crush(self):
         ''' Return the crush map associated to this Curve. '''
         
@@ -225,9 +229,10 @@ class Curve(MultiCurve):
         new_triangulation = curver.kernel.Triangulation([curver.kernel.Triangle([edge_map[edgy] for edgy in triangle]) for triangle in short.triangulation])
         
         # Build the lifting matrix back.
-        v = short.triangulation.vertex_lookup[a]  # = short.triangulation.vertex_lookup[~a].
-        indices = Counter([edge.index for edge in curver.kernel.utilities.cyclic_slice(v, a, ~a)[1:]])  # The indices that appear walking around v from a to ~a. Note need to exclude the initial a.
-        matrix = np.array([[indices[j] if i == b.index else 1 if (i == e.index and j == b.index) else 1 if i == j else 0 for i in range(self.zeta)] for j in range(self.zeta)], dtype=object)
+        indices = Counter([edge.index for edge in short.triangulation.fan(a)[1:]])  # The indices that appear walking around v from a to ~a. Note need to exclude the initial a.
+        matrix = np.identity(self.zeta, dtype=object)
+        matrix[b.index, e.index] = 1
+        matrix[:, b.index] = [indices[j] for j in range(self.zeta)]
         
         crush = curver.kernel.create.crush(short.triangulation, new_triangulation, short, matrix).encode()
         
@@ -1,11 +1,11 @@
 
 ''' A module for representing the curve complex of a surface. '''
 
-from itertools import combinations
+from collections import deque
 from math import factorial
-import networkx
 
 import curver
+from curver.kernel.decorators import memoize  # Special import needed for decorating.
 
 class CurveGraph:
     ''' This represents the curve complex of a surface.
@@ -22,15 +22,35 @@ class CurveGraph:
         self.BOUNDED_GEODESIC_IMAGE = 100  # BGIT.
         self.HYPERBOLICITY = 17  # Curve complex delta-hyperbolicity.
         # Uniform:
-        self.D = (self.zeta**(2 * self.zeta * (2*self.HYPERBOLICITY + 2)**2))**2  # Bowditch bound on denominator [Bow08].
-        # This explict bound comes from Theorems 6.2 & 6.3 of [Webb15] and Algorithm 3 of [BellWebb16].
-        # TODO 4) Recheck this.
+        # D, M and M2 are huge so they are only computed when they are first needed.
         self.XI = self.zeta // 2  # Actually should be 3g - 3 + n < 3g - 3 + 1.5n = zeta / 2
-        self.M = 28 * factorial(self.XI) * self.HYPERBOLICITY * self.D * self.BOUNDED_GEODESIC_IMAGE
         E, n = self.triangulation.euler_characteristic, self.triangulation.num_vertices
         self.R = 18*E**2 - 30*E - 10*n  # Gadre and Tsai bound away from zero [GadreTsai].
-        self.M2 = factorial(self.XI) * self.BOUNDED_GEODESIC_IMAGE * self.R
     
+    @property
+    @memoize
+    def D(self):
+        ''' Bowditch bound on denominator [Bow08]. '''
+        
+        return (self.zeta**(2 * self.zeta * (2*self.HYPERBOLICITY + 2)**2))**2
+    
+    @property
+    @memoize
+    def M(self):
+        ''' The number of iterates needed to compute the stable translation length exactly. '''
+        
+        # This explict bound comes from Theorems 6.2 & 6.3 of [Webb15] and Algorithm 3 of [BellWebb16].
+        # TODO 4) Recheck this.
+        return 28 * factorial(self.XI) * self.HYPERBOLICITY * self.D * self.BOUNDED_GEODESIC_IMAGE
+    
+    @property
+    @memoize
+    def M2(self):
+        ''' The number of iterates needed to certify that the stable translation length is positive. '''
+        
+        return factorial(self.XI) * self.BOUNDED_GEODESIC_IMAGE * self.R
+    
+    @memoize
     def quasiconvex(self, a, b):
         ''' Return a polynomial-sized K--quasiconvex subset of the curve complex that contains a and b.
         
@@ -52,17 +72,22 @@ class CurveGraph:
         short_b = conjugator_a(b)
         
         _, conjugator_b = short_b.shorten()
-        inv_conjugator_b = conjugator_b.inverse()
         
         train_track = short_b
+        inverse_moves = []  # The inverses of the moves applied so far, most recent last.
         quasiconvex = set([a, b])
-        for index, move in enumerate(reversed(conjugator_b), start=1):
+        for move in reversed(conjugator_b):
             train_track = move(train_track)
+            inverse_moves.append(move.inverse())
             vertex_cycle = train_track.vertex_cycle()
-            quasiconvex.add(inv_conjugator_a(inv_conjugator_b[:index](vertex_cycle)))
+            # Pull the vertex cycle back by applying the inverse moves directly rather than building an Encoding for each prefix.
+            for inverse_move in reversed(inverse_moves):
+                vertex_cycle = inverse_move(vertex_cycle)
+            quasiconvex.add(inv_conjugator_a(vertex_cycle))
         
         return quasiconvex
     
+    @memoize
     def tight_paths(self, a, b, length):
         ''' Return the set of all tight paths from a to b that are of the given length.
         
@@ -102,6 +127,7 @@ class CurveGraph:
             
             return P
     
+    @memoize
     def all_tight_geodesic_multicurves(self, a, b):
         ''' Return a set that contains all multicurves in any tight geodesic from a to b.
         
@@ -112,10 +138,13 @@ class CurveGraph:
         assert a.triangulation == self.triangulation
         assert b.triangulation == self.triangulation
         
-        guide = self.quasiconvex(a, b)  # U.
+        guide = list(self.quasiconvex(a, b))  # U.
         L = 6*self.QUASICONVEXITY + 2  # See [Webb15].
-        return set(multicurve for length in range(L+1) for c1 in guide for c2 in guide for path in self.tight_paths(c1, c2, length) for multicurve in path)
+        # The only tight path of length 0 is (c,) from c to itself and there are no longer tight paths from a multicurve to itself.
+        # So we can skip all of these calls to tight_paths.
+        return set(guide).union(multicurve for length in range(1, L+1) for c1 in guide for c2 in guide if c1 != c2 for path in self.tight_paths(c1, c2, length) for multicurve in path)
     
+    @memoize
     def tight_geodesic(self, a, b):
         ''' Return a tight geodesic in the (multi)curve complex from a to b.
         
@@ -128,10 +157,35 @@ class CurveGraph:
         
         # Build graph.
         vertices = list(self.all_tight_geodesic_multicurves(a, b))
-        edges = [(u, v) for u, v in combinations(vertices, r=2) if u.intersection(v) == 0 and u.no_common_component(v)]
-        G = networkx.Graph(edges)
-        
-        geodesic = networkx.algorithms.shortest_path(G, a, b)  # Find a geodesic from self to other, however this might not be tight.
+        # Since shorten is memoized, each vertex is only shortened once and i(u, v) then costs one pass of v through
+        # the conjugator of u. So we compute each intersection from whichever end has the shorter conjugator.
+        cost = dict((vertex, len(vertex.shorten()[1])) for vertex in vertices)
+        
+        def adjacent(u, v):
+            ''' Return whether u and v are joined by an edge of the graph. '''
+            # Once components have been computed no_common_component is just a handful of lookups, so test it first.
+            return u.no_common_component(v) and (u.intersection(v) if cost[u] <= cost[v] else v.intersection(u)) == 0
+        
+        # Find a geodesic from self to other, however this might not be tight.
+        # The graph is unweighted so a breadth-first search from a suffices. We only discover the edges of the graph as we need
+        # them, so we never test whether two vertices that have already been reached are adjacent and we can stop as soon as we reach b.
+        lookup = dict((vertex, index) for index, vertex in enumerate(vertices))
+        source, target = lookup[a], lookup[b]
+        parent = {source: None}
+        queue = deque([source])
+        while queue and target not in parent:
+            current = queue.popleft()
+            for neighbour, vertex in enumerate(vertices):
+                if neighbour not in parent and adjacent(vertices[current], vertex):
+                    parent[neighbour] = current
+                    queue.append(neighbour)
+        
+        geodesic = []
+        current = target
+        while current is not None:
+            geodesic.append(vertices[current])
+            current = parent[current]
+        geodesic.reverse()
         
         for i in range(1, len(geodesic)-1):
             geodesic[i] = geodesic[i-1].boundary_union(geodesic[i+1])  # Tighten.
@@ -149,11 +203,14 @@ class CurveGraph:
         assert a.triangulation == self.triangulation
         assert b.triangulation == self.triangulation
         
-        return tuple(multicurve.peek_component() for multicurve in self.tight_geodesic(a, b))  # pylint: disable=no-member
+        return tuple(multicurve.peek_component() for multicurve in self.tight_geodesic(a, b))
     
     def distance(self, a, b):
         ''' Return the distance from a to b in the curve complex. '''
         
+        if a == b:
+            return 0
+        
         # Could use self.tight_geodesic(a, b).
         return len(self.geodesic(a, b)) - 1
 
@@ -1,30 +1,59 @@
 
 ''' A module for decorators. '''
 
+from functools import wraps
 import inspect
-from decorator import decorator
+from types import SimpleNamespace
 
-@decorator
-def memoize(function, *args, **kwargs):
+_MISSING = object()  # A sentinel for cache misses, since None is a valid answer.
+
+def memoize(function):
     ''' A decorator that memoizes a function. '''
     
-    inputs = inspect.getcallargs(function, *args, **kwargs)  # pylint: disable=deprecated-method
-    self = inputs.pop('self', function)  # We test whether function is a method by looking for a `self` argument. If not we store the cache in the function itself.
+    signature = inspect.signature(function)  # Only inspect the function once. This sees through any other decorators on function.
+    parameters = list(signature.parameters.values())
+    # Whether function is a method whose arguments can all be given positionally. In which case a call that does give all of them
+    # positionally has its key already in the right order and so does not need binding.
+    positional = bool(parameters) and parameters[0].name == 'self' and all(parameter.kind == parameter.POSITIONAL_OR_KEYWORD for parameter in parameters)
+    num_parameters = len(parameters)
+    name = function.__name__
     
-    if not hasattr(self, '_cache'):
-        self._cache = dict()
-    key = (function.__name__, frozenset(inputs.items()))
-    if key not in self._cache:
+    @wraps(function)
+    def memoized(*args, **kwargs):
+        ''' The memoized version of function. '''
+        
+        if positional and len(args) == num_parameters and not kwargs:  # Fast path, there is nothing to bind.
+            self, key = args[0], args[1:]
+        else:
+            inputs = signature.bind(*args, **kwargs)
+            inputs.apply_defaults()
+            self = inputs.arguments.pop('self', function)  # We test whether function is a method by looking for a `self` argument. If not we store the cache in the function itself.
+            key = tuple(inputs.arguments.values())  # bind orders the arguments as in the signature so this is canonical.
+        
+        # Each function gets its own table within the cache so that its name does not need to be part of every key.
+        # Almost every call finds both the cache and this table already exist so ask for forgiveness rather than permission.
         try:
-            self._cache[key] = function(*args, **kwargs)
-        except Exception as error:  # pylint: disable=broad-except
-            self._cache[key] = error
+            cache = self._cache[name]
+        except AttributeError:  # No cache yet.
+            cache = dict()
+            self._cache = {name: cache}
+        except KeyError:  # No table yet.
+            cache = self._cache[name] = dict()
+        
+        result = cache.get(key, _MISSING)  # A hit is now a single dictionary lookup.
+        if result is _MISSING:  # Not computed yet.
+            try:
+                result = function(*args, **kwargs)
+            except Exception as error:  # pylint: disable=broad-except
+                result = error
+            cache[key] = result
+        
+        if isinstance(result, Exception):
+            raise result
+        else:
+            return result
     
-    result = self._cache[key]
-    if isinstance(result, Exception):
-        raise result
-    else:
-        return result
+    return memoized
 
 def memoizable(cls):
     ''' A class decorator that add the 'set_cache' method to a class. '''
@@ -32,13 +61,14 @@ def memoizable(cls):
     def set_cache(self, function, answer, *args, **kwargs):
         ''' Set self._cache so that self.function(*args, **kwargs) returns `answer`. '''
         
-        inputs = inspect.getcallargs(function, *args, **kwargs)  # pylint: disable=deprecated-method
-        self = inputs.pop('self')
+        inputs = inspect.signature(function).bind(*args, **kwargs)
+        inputs.apply_defaults()
+        self = inputs.arguments.pop('self')
         
         if not hasattr(self, '_cache'):
             self._cache = dict()
-        key = (function.__name__, frozenset(inputs.items()))
-        self._cache[key] = answer
+        key = tuple(inputs.arguments.values())
+        self._cache.setdefault(function.__name__, dict())[key] = answer
     
     setattr(cls, 'set_cache', set_cache)
     return cls
@@ -61,17 +91,27 @@ def conjugacy_invariant(function):
 
 def ensure(*fs):
     ''' A decorator that specifies properties that the result of a functions should have. '''
-    @decorator
-    def wrapper(function, *args, **kwargs):
-        ''' A decorator that checks that the result of a function has properties fs. '''
+    def wrapper(function):
+        ''' Decorate function so that its result is checked against fs. '''
+        
+        if not __debug__:  # The checks are assertions so under python -O there is nothing to do, not even binding the arguments.
+            return function
         
-        result = function(*args, **kwargs)
-        data = type('data', (), inspect.getcallargs(function, *args, **kwargs))  # pylint: disable=deprecated-method
-        data.result = result
+        signature = inspect.signature(function)  # Only inspect the function once.
         
-        for f in fs:
-            assert f(data)
-        return result
+        @wraps(function)
+        def checker(*args, **kwargs):
+            ''' A decorator that checks that the result of a function has properties fs. '''
+            
+            result = function(*args, **kwargs)
+            inputs = signature.bind(*args, **kwargs)
+            inputs.apply_defaults()
+            data = SimpleNamespace(result=result, **inputs.arguments)
+            
+            for f in fs:
+                assert f(data)
+            return result
+        
+        return checker
     
     return wrapper
-
@@ -2,7 +2,7 @@
 ''' A module for representing and manipulating maps between Triangulations. '''
 
 from fractions import Fraction
-import operator
+from itertools import chain
 import numpy as np
 
 import curver
@@ -26,7 +26,7 @@ class Encoding:
         if len(sequence) > 1 and isinstance(sequence[0], curver.kernel.Isometry) and sequence[0].is_identity():
             sequence = sequence[1:]
         
-        self.sequence = sequence
+        self.sequence = tuple(sequence)  # Immutable, so it can be shared between encodings. This does not copy if sequence is already a tuple.
         
         self.source_triangulation = self.sequence[-1].source_triangulation
         self.target_triangulation = self.sequence[0].target_triangulation
@@ -35,11 +35,14 @@ class Encoding:
     def __repr__(self):
         return f'{self.source_triangulation}: {self.package()}'
     def __str__(self):
-        return f'Encoding {self.sequence}'
+        return f'Encoding {list(self.sequence)}'
     def __iter__(self):
         return iter(self.sequence)
     def __len__(self):
         return len(self.sequence)
+    def __reversed__(self):
+        # Without this reversed(self) would fall back to calling __getitem__ for each item.
+        return reversed(self.sequence)
     def __getitem__(self, value):
         if isinstance(value, slice):
             # It turns out that handling all slices correctly is really hard.
@@ -49,26 +52,25 @@ class Encoding:
             #   self == self[:i] * self[i:j] * self[j:]
             # even when i == j.
             
-            start = 0 if value.start is None else value.start if value.start >= 0 else len(self) + value.start
-            stop = len(self) if value.stop is None else value.stop if value.stop >= 0 else len(self) + value.stop
-            start = max(start, -len(self))
-            stop = min(stop, len(self))
+            if value.step not in (None, 1):
+                raise ValueError('Encodings can only be sliced with a step of 1')
+            
+            start, stop, _ = value.indices(len(self))
             if start == stop:
-                if 0 <= start < len(self):
+                if start < len(self):
                     return self.sequence[start].target_triangulation.id_encoding()
-                elif start == len(self):
+                else:  # start == len(self).
                     return self.source_triangulation.id_encoding()
-                else:
-                    raise IndexError('list index out of range')
             elif stop < start:
                 raise IndexError('list index out of range')
             else:  # start < stop.
-                triangulation = self.sequence[stop-1].source_triangulation
-                return triangulation.encode(self.sequence[value])
+                sequence = self.sequence[start:stop]
+                return sequence[-1].source_triangulation.encode(sequence)
         elif isinstance(value, curver.IntegerType):
             return self.sequence[value]
         else:
             return NotImplemented
+    @memoize
     def package(self):
         ''' Return a small amount of info that self.source_triangulation can use to reconstruct this triangulation. '''
         return [item.package() for item in self]
@@ -77,53 +79,126 @@ class Encoding:
     
     def __eq__(self, other):
         if isinstance(other, Encoding):
+            if self is other:
+                return True
             if self.source_triangulation != other.source_triangulation or self.target_triangulation != other.target_triangulation:
                 return False
+            if type(self).__hash__ is type(other).__hash__ and hash(self) != hash(other):  # Hashes are memoized so this is cheap after the first time.
+                return False
             
-            return all(self(arc.boundary()) == other(arc.boundary()) for arc in self.source_triangulation.edge_arcs())
+            return self.edge_arc_boundary_images() == other.edge_arc_boundary_images()
         else:
             return NotImplemented
+    @memoize
     def __hash__(self):
         # In fact this hash is perfect unless the surface is S_{1,1}.
-        return hash(tuple(entry for arc in self.source_triangulation.edge_arcs() for entry in self(arc.boundary())))
+        return hash(tuple(tuple(image) for image in self.edge_arc_boundary_images()))
+    
+    @memoize
+    def edge_arc_boundary_images(self):
+        ''' Return a tuple containing the image of the boundary of each edge arc of self.source_triangulation.
+        
+        Except when on S_{1,1}, these determine self and so they are shared by __eq__ and __hash__. '''
+        
+        return self.apply_laminations(self.source_triangulation.edge_arc_boundaries())
     
     def __call__(self, other):
         if self.source_triangulation != other.triangulation:
             raise ValueError('Cannot apply an Encoding to something on a triangulation other than source_triangulation')
         
         if isinstance(other, curver.kernel.Lamination):
-            for item in reversed(self):
-                other = item.apply_lamination(other)
+            # Runs of EdgeFlips are applied directly to a single list of weights and we only
+            # build a Lamination when we reach a move that needs one or the end of the sequence.
+            geometric = None
+            for item in reversed(self.sequence):  # Skips dispatching through self.__reversed__ on this hot path.
+                if isinstance(item, curver.kernel.EdgeFlip):
+                    if geometric is None:
+                        geometric = list(other.geometric)
+                    item.apply_geometric(geometric)
+                else:
+                    if geometric is not None:
+                        other = other.__class__(item.source_triangulation, geometric)  # Avoids promote.
+                        geometric = None
+                    other = item.apply_lamination(other)
+            if geometric is not None:
+                other = other.__class__(self.target_triangulation, geometric)  # Avoids promote.
         elif isinstance(other, curver.kernel.HomologyClass):
-            for item in reversed(self):
-                other = item.apply_homology(other)
+            other = self.apply_homologies([other])[0]
         else:
             raise TypeError(f'Unknown type {other}')
         
         return other
+    def apply_laminations(self, laminations):
+        ''' Return a tuple containing the image of each of the given laminations under self.
+        
+        This pushes all of the laminations through the sequence together, which is faster than applying self to each in turn. '''
+        
+        if any(self.source_triangulation != lamination.triangulation for lamination in laminations):
+            raise ValueError('Cannot apply an Encoding to something on a triangulation other than source_triangulation')
+        
+        # As in __call__, runs of EdgeFlips are applied directly to the lists of weights.
+        classes = [lamination.__class__ for lamination in laminations]
+        geometrics = [list(lamination.geometric) for lamination in laminations]
+        for item in reversed(self.sequence):
+            if isinstance(item, curver.kernel.EdgeFlip):
+                for geometric in geometrics:
+                    item.apply_geometric(geometric)
+            else:
+                images = [item.apply_lamination(cls(item.source_triangulation, geometric)) for cls, geometric in zip(classes, geometrics)]  # Avoids promote.
+                classes = [image.__class__ for image in images]
+                geometrics = [list(image.geometric) for image in images]
+        
+        return tuple(cls(self.target_triangulation, geometric) for cls, geometric in zip(classes, geometrics))  # Avoids promote.
+    def apply_homologies(self, homology_classes):
+        ''' Return a tuple containing the image of each of the given homology classes under self.
+        
+        As in apply_laminations, all of the homology classes are pushed through the sequence together. '''
+        
+        if any(self.source_triangulation != homology_class.triangulation for homology_class in homology_classes):
+            raise ValueError('Cannot apply an Encoding to something on a triangulation other than source_triangulation')
+        
+        algebraics = [list(homology_class.algebraic) for homology_class in homology_classes]
+        for item in reversed(self.sequence):
+            if isinstance(item, curver.kernel.EdgeFlip):
+                for algebraic in algebraics:
+                    item.apply_algebraic(algebraic)
+            else:
+                algebraics = [item.apply_homology(curver.kernel.HomologyClass(item.source_triangulation, algebraic)).algebraic for algebraic in algebraics]
+        
+        return tuple(curver.kernel.HomologyClass(self.target_triangulation, algebraic) for algebraic in algebraics)
     def __mul__(self, other):
         if isinstance(other, Encoding):
             if self.source_triangulation != other.target_triangulation:
                 raise ValueError('Cannot compose Encodings over different triangulations')
             
+            # Composing with an identity isometry does not change the other sequence so share it rather than copying it.
+            is_identity = lambda encoding: len(encoding) == 1 and isinstance(encoding.sequence[0], curver.kernel.Isometry) and encoding.sequence[0].is_identity()
+            if is_identity(other):
+                sequence = self.sequence
+            elif is_identity(self):
+                sequence = other.sequence
+            else:
+                sequence = self.sequence + other.sequence
+            
             # We could do
-            #   return Encoding(self.sequence + other.sequence).promote()
+            #   return Encoding(sequence).promote()
             # but since we know the types of self and other we can avoid rechecking the move types.
             if not (isinstance(self, Mapping) and isinstance(other, Mapping)):
-                return Encoding(self.sequence + other.sequence)
+                return Encoding(sequence)
             else:  # self and other both at least Mappings:
                 if self.target_triangulation != other.source_triangulation:
-                    return Mapping(self.sequence + other.sequence)
+                    return Mapping(sequence)
                 else:  # self.target_triangulation == other.source_triangulation:
-                    return MappingClass(self.sequence + other.sequence)
+                    return MappingClass(sequence)
         elif other is None:
             return self
         else:
             return NotImplemented
+    @memoize
     def inverse(self):
         ''' Return the inverse of this encoding. '''
         
-        return self.__class__([item.inverse() for item in reversed(self.sequence)])  # Data structure issue.
+        return self.__class__(tuple(item.inverse() for item in reversed(self.sequence)))  # Data structure issue.
     def __invert__(self):
         return self.inverse()
     def promote(self):
@@ -141,7 +216,7 @@ class Mapping(Encoding):
     
     Hence this encoding is a sequence of moves in the same flip graph. '''
     def __str__(self):
-        return f'Mapping {self.sequence}'
+        return f'Mapping {list(self.sequence)}'
     
     @memoize
     def self_image(self):
@@ -155,7 +230,10 @@ class Mapping(Encoding):
         
         Except when on S_{1,1}, this uniquely determines self. '''
         
-        return np.array([list(self(arc)) for arc in self.source_triangulation.edge_arcs()], dtype=object)
+        # Push all of the arcs through the sequence together rather than walking the whole sequence once per arc.
+        images = self.apply_laminations(self.source_triangulation.edge_arcs())
+        
+        return np.array([image.geometric for image in images], dtype=object)
     
     @memoize
     def homology_matrix(self):
@@ -166,14 +244,19 @@ class Mapping(Encoding):
         source_basis = self.source_triangulation.homology_basis()
         target_basis = self.target_triangulation.homology_basis()
         
-        source_images = [self(hc).canonical() for hc in source_basis]
+        source_images = np.array([image.canonical().algebraic for image in self.apply_homologies(source_basis)], dtype=object).reshape(len(source_basis), self.source_triangulation.zeta)
+        target_matrix = np.array([hc2.algebraic for hc2 in target_basis], dtype=object).reshape(len(target_basis), self.target_triangulation.zeta)
         
-        return np.array([[sum(x * y for x, y in zip(hc, hc2)) for hc in source_images] for hc2 in target_basis], dtype=object)
+        return target_matrix.dot(source_images.T)
     
     def __eq__(self, other):
         if isinstance(other, Encoding):
+            if self is other:
+                return True
             if self.source_triangulation != other.source_triangulation or self.target_triangulation != other.target_triangulation:
                 return False
+            if type(self).__hash__ is type(other).__hash__ and hash(self) != hash(other):  # Hashes are memoized so this is cheap after the first time.
+                return False
             
             return self.self_image() == other.self_image() and np.array_equal(self.homology_matrix(), other.homology_matrix())  # We only really need this for S_{1,1}.
         else:
@@ -183,13 +266,14 @@ class Mapping(Encoding):
     def __hash__(self):
         return hash(self.self_image())
     
+    @memoize
     def vertex_map(self):
         ''' Return the dictionary (vertex, self(vertex)) for each vertex in self.source_triangulation.
         
         When self is a MappingClass this is a permutation of the vertices. '''
         
-        source_vertices = dict((vertex, self.source_triangulation.curve_from_cut_sequence(vertex)) for vertex in self.source_triangulation.vertices)
-        target_vertices_inverse = dict((self.target_triangulation.curve_from_cut_sequence(vertex), vertex) for vertex in self.target_triangulation.vertices)
+        source_vertices = self.source_triangulation.vertex_curves()
+        target_vertices_inverse = dict((curve, vertex) for vertex, curve in self.target_triangulation.vertex_curves().items())
         
         return dict((vertex, target_vertices_inverse[self(source_vertices[vertex])]) for vertex in self.source_triangulation.vertices)
     
@@ -201,22 +285,27 @@ class Mapping(Encoding):
         _, conjugator = self(self.source_triangulation.as_lamination()).shorten()
         # conjugator.inverse() is almost self, however the edge labels might not agree.
         
-        potential_closers = [isom.encode() for isom in self.source_triangulation.isometries_to(conjugator.target_triangulation)]
+        potential_closers = self.source_triangulation.isometries_to(conjugator.target_triangulation)  # A generator, so we stop searching once we find the closer.
         
         # We used to test:
         #   if potential_closer.inverse() * conjugator * self == identity
         # However since conjugator * self preserves self.source_triangulation.as_lamination() it is periodic, and so we can find the correct closer simply
         # by finding the one that induces the same action on homology since the only periodic mapping class in the Torelli group is the identity.
+        # As these actions are linear it is enough to compare them on a basis and, since the closer is unique, we can stop as soon as we find it.
         
-        homology_images = [conjugator(self(hc)) for hc in self.source_triangulation.edge_homologies()]
-        [closer] = [potential_closer for potential_closer in potential_closers if all(potential_closer(hc) == hci for hc, hci in zip(self.source_triangulation.edge_homologies(), homology_images))]
+        homology_basis = self.source_triangulation.homology_basis()
+        homology_images = conjugator.apply_homologies(self.apply_homologies(homology_basis))
+        closer = next((potential_closer for potential_closer in potential_closers if all(potential_closer(hc) == hci for hc, hci in zip(homology_basis, homology_images))), None)
+        if closer is None:
+            raise ValueError('No isometry closes the conjugator')
         
-        return conjugator.inverse() * closer
+        return conjugator.inverse() * closer.encode()  # Only the closer needs to be encoded.
     
     def flip_mapping(self):
         ''' Return a Mapping equal to self that only uses EdgeFlips and Isometries. '''
         
-        return self.__class__([item for move in self for item in move.flip_mapping()])
+        # EdgeFlips and Isometries are already allowed so we keep them as they are rather than building (and promoting) a one move Mapping for each.
+        return self.__class__(tuple(chain.from_iterable((move,) if isinstance(move, (curver.kernel.EdgeFlip, curver.kernel.Isometry)) else move.flip_mapping().sequence for move in self.sequence)))
     
     def pl_action(self, multicurve):
         ''' Return the PartialLinearFunction that this Mapping applies to the given multicurve. '''
@@ -259,12 +348,17 @@ class MappingClass(Mapping):
     def __call__(self, other, power=1):
         if power < 0:
             return self.inverse()(other, power=-power)
+        if power == 0:
+            return other
         
+        # Rather than building the Encoding self**power, whose sequence is power times as long, we apply self repeatedly.
+        # Encoding.__call__ also checks that we can apply self to other and pushes laminations through runs of flips without rebuilding them.
         for _ in range(power):
             other = super().__call__(other)
         return other
     def __str__(self):
-        return f'MappingClass {self.sequence}'
+        return f'MappingClass {list(self.sequence)}'
+    @memoize
     def __pow__(self, k):
         if k == 0:
             return self.source_triangulation.id_encoding()
@@ -276,8 +370,7 @@ class MappingClass(Mapping):
     def is_in_torelli(self):
         ''' Return whether this mapping class is in the Torelli subgroup. '''
         
-        homology_matrix = self.homology_matrix()
-        return np.array_equal(homology_matrix, np.identity(homology_matrix.shape[0], dtype=object))
+        return curver.kernel.utilities.is_identity_matrix(self.homology_matrix())
     
     @memoize
     def order(self):
@@ -290,26 +383,31 @@ class MappingClass(Mapping):
         #  - If self**i == identity then self**(ij) == identity.
         #  - if self**i == identity and self**j == identity then self**gcd(i, j) == identity.
         #
-        # But in terms of raw speed there doesn't appear to be anything faster than:
+        # But in terms of raw speed there doesn't appear to be anything faster than using the first of these.
+        # It means that the order of self is a multiple of the order of its action on homology, so we find that
+        # first since it is cheap and often rules everything out.
         
         homology_matrix = self.homology_matrix()
-        originals = [np.identity(homology_matrix.shape[0], dtype=object), self.source_triangulation.as_lamination()]
-        images = list(originals)
-        cmps = [np.array_equal, operator.eq]
-        applies = [homology_matrix.dot, self]
-        powers = [0, 0]
-        for power in range(1, self.source_triangulation.max_order()+1):
-            for i in range(len(originals)):  # pylint: disable=consider-using-enumerate
-                while powers[i] < power:
-                    images[i] = applies[i](images[i])
-                    powers[i] += 1
-                if not cmps[i](images[i], originals[i]):
-                    break
-            else:
+        max_order = self.source_triangulation.max_order()
+        matrix = homology_matrix
+        for homology_order in range(1, max_order+1):
+            if curver.kernel.utilities.is_identity_matrix(matrix):
+                break
+            matrix = homology_matrix.dot(matrix)
+        else:
+            return 0
+        
+        # Now we only need to apply self to the lamination and test it at multiples of homology_order.
+        original = self.source_triangulation.as_lamination()
+        lamination = original
+        for power in range(homology_order, max_order+1, homology_order):
+            lamination = self(lamination, power=homology_order)
+            if lamination.geometric == original.geometric:  # Both lie on self.source_triangulation so we only need to compare weights.
                 return power
         
         return 0
     
+    @memoize
     def vertex_permutation(self):
         ''' Return a permutation describing how the vertices of self.source_triangulation (labelled in sorted order) are permuted. '''
         
@@ -326,6 +424,7 @@ class MappingClass(Mapping):
         
         return self.order() > 0
     
+    @memoize
     def is_reducible(self):
         ''' Return whether this mapping class is reducible. '''
         
@@ -335,7 +434,7 @@ class MappingClass(Mapping):
             genus = lambda orbifold: (2 - orbifold.euler_characteristic - sum(1 - (0 if cone_point.punctured else Fraction(1, cone_point.order)) for cone_point in orbifold.cone_points)) // 2
             return not all(len(orbifold.cone_points) == 3 and genus(orbifold) == 0 for orbifold in self.subgroup().quotient_orbifold_signature())
         else:
-            C = curver.kernel.CurveGraph(self.source_triangulation)
+            C = self._curve_graph()
             c = self.source_triangulation.edge_curve(0)  # A "short" curve.
             
             # Set some constants.
@@ -360,6 +459,7 @@ class MappingClass(Mapping):
         
         return not self.is_periodic() and not self.is_reducible()
     
+    @memoize
     def nielsen_thurston_type(self):
         ''' Return the Nielsen--Thurston type of this mapping class. '''
         
@@ -370,20 +470,37 @@ class MappingClass(Mapping):
         else:  # self.is_pesudo_anosov():
             return NT_TYPE_PSEUDO_ANOSOV
     
+    @memoize
+    def _curve_graph(self):
+        ''' Return the CurveGraph of self.source_triangulation that is shared by the methods of this mapping class. '''
+        
+        return curver.kernel.CurveGraph(self.source_triangulation)
+    
+    @memoize
+    def _translation_midpoint(self, power):
+        ''' Return the midpoint m of a geodesic from a short curve c to self(c, power) together with self(m, power). '''
+        
+        C = self._curve_graph()
+        c = self.source_triangulation.edge_arc(0).boundary()  # A "short" curve.
+        geodesic = C.geodesic(c, self(c, power=power))
+        m = geodesic[len(geodesic)//2]  # midpoint
+        
+        return m, self(m, power=power)
+    
+    @memoize
     def asymptotic_translation_length(self):
         ''' Return the asymptotic translation length of this mapping class on the curve complex.
         
         From Algorithm 6 of [BellWebb16]_. '''
         
-        C = curver.kernel.CurveGraph(self.source_triangulation)
-        c = self.source_triangulation.edge_arc(0).boundary()  # A "short" curve.
-        geodesic = C.geodesic(c, self(c, power=C.M))
-        m = geodesic[len(geodesic)//2]  # midpoint
+        C = self._curve_graph()
+        m, image = self._translation_midpoint(C.M)
         
-        numerator = C.distance(m, self(m, power=C.M))
+        numerator = C.distance(m, image)
         denominator = C.M
         return Fraction(numerator, denominator).limit_denominator(C.D)
     
+    @memoize
     def positive_asymptotic_translation_length(self):
         ''' Return whether the asymptotic translation length of this mapping class on the curve complex is positive.
         
@@ -391,12 +508,10 @@ class MappingClass(Mapping):
         
             self.asymptotic_translation_length() > 0 '''
         
-        C = curver.kernel.CurveGraph(self.source_triangulation)
-        c = self.source_triangulation.edge_arc(0).boundary()  # A "short" curve.
-        geodesic = C.geodesic(c, self(c, power=C.M2))
-        m = geodesic[len(geodesic)//2]  # midpoint
+        C = self._curve_graph()
+        m, image = self._translation_midpoint(C.M2)
         
-        return C.distance(m, self(m, power=C.M2)) > 4
+        return C.distance(m, image) > 4
     
     @memoize
     def subgroup(self):
@@ -454,6 +569,7 @@ class MappingClass(Mapping):
         # If this is a multitwist then for each component c there are at most three powers of self for
         # which T_c(self^i(lamination)) does not change by adding c. Since there are at most
         # 3g - 3 + p components, this means that there are at most 2 zeta bad powers.
+        tested = set()  # The same candidate often appears for many powers and building its twist is expensive, so we only test each one once.
         for _ in range(2 * self.zeta):
             lamination = self(lamination)
             image = self(lamination)
@@ -463,8 +579,10 @@ class MappingClass(Mapping):
                     weighted_multicurve = triangulation.disjoint_sum(dict(
                         (component, multiplicity // lamination.intersection(component)) for component, multiplicity in multicurve.components().items()
                         ))
-                    if not weighted_multicurve.is_empty() and weighted_multicurve.encode_twist() == self:
-                        return weighted_multicurve
+                    if not weighted_multicurve.is_empty() and weighted_multicurve not in tested:
+                        if weighted_multicurve.encode_twist() == self:
+                            return weighted_multicurve
+                        tested.add(weighted_multicurve)
             except ValueError:
                 pass
             lamination = image
@@ -2,7 +2,6 @@
 ''' A module for representing and manipulating finite subgroups of a mapping class group. '''
 
 from collections import defaultdict, namedtuple
-from copy import deepcopy
 from fractions import Fraction
 from itertools import groupby
 from queue import Queue
@@ -97,13 +96,15 @@ class FiniteSubgroup:
             #   H_images[i][j] = H[i](edge_j)
             # These make it easy to test whether the H--orbit of edge_j is embedded: this occurs iff
             #   H_images[i][j](j) <= 0 for every 0 <= i < |H|.
-            # Note that since we will be needing this repeatedly, we will create the original here and
-            # make a deepcopy at the start of each calculation later.
-            original_H_images = [[h(arc) for arc in triangulation.edge_arcs()] for h in H]
+            # Note that since we will be needing this repeatedly, we will create the original here and reuse it later.
+            original_H_images = [h.apply_laminations(triangulation.edge_arcs()) for h in H]
+            
+            # The weight of invariant_multiarc on each edge.
+            weights = dict((edge, invariant_multiarc(edge)) for edge in triangulation.positive_edges)
             
             # Initially we have to check every edge, so we do this once here to avoid repeating it for every image in the next loop.
             for edge in triangulation.positive_edges:
-                if invariant_multiarc(edge) == 0 and all(images[edge.index](edge) <= 0 for images in original_H_images):  # if not existing component and H--orbit is embedded.
+                if weights[edge] == 0 and all(images[edge.index](edge) <= 0 for images in original_H_images):  # if not existing component and H--orbit is embedded.
                     arc = triangulation.edge_arc(edge)
                     invariant_multiarc = triangulation.disjoint_sum([invariant_multiarc] + list(orbit(arc)))  # Add it to the invariant arc.
                     break
@@ -111,13 +112,13 @@ class FiniteSubgroup:
                 # Theorem: For any arc a there is an h in H such that there is a unicorn of a and h(a) whose H--orbit is embedded.
                 # In fact if a is an arc that does not cut off a disk in S - invariant_multiarc then the obtained unicorn is also disjoint and not a component of invariant_multiarc.
                 # Such an arc exists since invariant_multiarc is not a polygonalisation, and in fact one of the edges of triangulation must be one since invariant_multiarc is short.
-                dual_tree = triangulation.dual_tree(avoid={edge for edge in triangulation.positive_edges if invariant_multiarc(edge) < 0})
-                arc = triangulation.edge_arc([edge for edge in triangulation.positive_edges if edge.index not in dual_tree and invariant_multiarc(edge) == 0][0])
+                dual_tree = triangulation.dual_tree(avoid={edge for edge in triangulation.positive_edges if weights[edge] < 0})
+                arc = triangulation.edge_arc([edge for edge in triangulation.positive_edges if edge.index not in dual_tree and weights[edge] == 0][0])
                 
                 done = False
                 for image in orbit(arc):  # Loops at most |H| times.
                     # Check the unicorn arcs that can be made from arc and image.
-                    H_images = deepcopy(original_H_images)  # Get a fresh copy to work with.
+                    H_images = original_H_images  # Start again from the originals.
                     _, image_conjugator = image.shorten(drop=0)  # The Mosher sequence from image back to arc, this contains all the unicorn arcs.
                     # Theorem: Since arc is short, the set of arcs that appear in the Mosher flip sequence includes all unicorns made from arc and image.
                     for index, move in enumerate(reversed(image_conjugator)):  # Loops at most ||H|| times.
@@ -189,29 +190,29 @@ class FiniteSubgroup:
                 arc = triangulation.edge_arc(edge)
                 hc = triangulation.edge_homology(edge)
                 if len(arc.vertices()) == 1:
-                    [v] = arc.vertices()
-                    v_edges = curver.kernel.utilities.cyclic_slice(v, edge, ~edge)
+                    v_edges = triangulation.fan(edge)
                     boundary = triangulation.curve_from_cut_sequence(v_edges[1:])
                 else:  # two vertices:
                     boundary = arc.boundary()
                 oriented[edge] = OrientedArc(arc, hc, boundary)
-        oriented_arcs = list(oriented.values())
+        # From here on we refer to each oriented arc by its edge.
+        edge_lookup = dict((oriented_arc, edge) for edge, oriented_arc in oriented.items())
         
         # Build some useful maps.
         # A) For each pair of oriented arcs, the set of H (names) that map one to the other.
-        pairs = dict((a, dict((b, set()) for b in oriented_arcs)) for a in oriented_arcs)
-        for a in oriented_arcs:
+        pairs = dict((a, dict((b, set()) for b in oriented)) for a in oriented)
+        for a, oriented_arc in oriented.items():
             for name, h in H.items():
-                b = OrientedArc(h(a.arc), h(a.hc), h(a.boundary))
+                b = edge_lookup[OrientedArc(h(oriented_arc.arc), h(oriented_arc.hc), h(oriented_arc.boundary))]
                 pairs[a][b].add(name)
         
         # B) The component of triangulation each oriented_arc lives in.
-        component_lookup = dict((oriented[edge], component) for component in components for edge in component if edge in oriented)
+        component_lookup = dict((edge, component) for component in components for edge in component if edge in oriented)
         
         # C) The size of the orbit of each component of triangulation under the action of h.
         classes = curver.kernel.UnionFind(components)
-        for a in oriented_arcs:
-            for b in oriented_arcs:
+        for a in oriented:
+            for b in oriented:
                 if pairs[a][b]:
                     classes.union(component_lookup[a], component_lookup[b])
         component_orbit_size = dict()
@@ -236,7 +237,7 @@ class FiniteSubgroup:
                         polygon_edges = polygon_edges[:-1]  # Remeber to discard the last edge as it duplicates the first.
                         break
                 
-                used = used.union(polygon_edges)  # Mark everything as used.
+                used.update(polygon_edges)  # Mark everything as used.
                 polygons.append(polygon_edges)
         
         # There are three places to look for cone points:
@@ -249,9 +250,8 @@ class FiniteSubgroup:
         
         cone_points = defaultdict(list)
         for punctured, edges in candidates:
-            oriented_arcs = [oriented[edge] for edge in edges]
-            start = oriented_arcs[0]
-            places = [a for a in oriented_arcs[1:] + oriented_arcs[:1] if pairs[start][a]]  # ??
+            start = edges[0]
+            places = [a for a in edges[1:] + edges[:1] if pairs[start][a]]  # ??
             
             c_order = len(places)
             holonomy = sorted(pairs[start][places[0]])
@@ -264,8 +264,8 @@ class FiniteSubgroup:
         signature = sorted(Orbifold(euler_characteristic[component], component_orbit_size[component], sorted(cone_points[component])) for component in components)
         
         # Group.
-        signature = [key for key, group in groupby(signature) for _ in range(len(list(group)) // key.preimages)]
-        signature = [Orbifold(orbifold.euler_characteristic, orbifold.preimages, [key for key, group in groupby(orbifold.cone_points) for _ in range(len(list(group)) // key.preimages)]) for orbifold in signature]
+        signature = [key for key, group in groupby(signature) for _ in range(sum(1 for _ in group) // key.preimages)]
+        signature = [Orbifold(orbifold.euler_characteristic, orbifold.preimages, [key for key, group in groupby(orbifold.cone_points) for _ in range(sum(1 for _ in group) // key.preimages)]) for orbifold in signature]
         return signature
 
     def is_conjugate_to(self, other):
@@ -39,9 +39,11 @@ class Lamination:
         return iter(self.geometric)
     def __call__(self, edge):
         ''' Return the geometric measure assigned to item. '''
-        if isinstance(edge, curver.IntegerType): edge = curver.kernel.Edge(edge)  # If given an integer instead.
-        
-        return self.geometric[edge.index]
+        # This is called for almost every weight lookup so avoid the (slow) isinstance check against IntegerType.
+        try:
+            return self.geometric[edge.index]
+        except AttributeError:  # If given an integer instead.
+            return self.geometric[curver.kernel.Edge(edge).index]
     def __bool__(self):
         return not self.is_empty()
     def __nonzero__(self):  # For Python2.
@@ -101,8 +103,10 @@ class Lamination:
         
         if isinstance(edge, curver.IntegerType): edge = curver.kernel.Edge(edge)  # If given an integer instead.
         
-        i, j, k = self.triangulation.corner_lookup[edge]
-        a, b, c = self.geometric[i.index], self.geometric[j.index], self.geometric[k.index]
+        corner = self.triangulation.corner_lookup[edge]
+        geometric = self.geometric
+        i, j, k = corner.indices  # Faster than going via each Edge of the corner.
+        a, b, c = geometric[i], geometric[j], geometric[k]
         af, bf, cf = max(a, 0), max(b, 0), max(c, 0)  # Correct for negatives.
         correction = min(af + bf - cf, bf + cf - af, cf + af - bf, 0)
         dual = bf + cf - af + correction
@@ -110,7 +114,7 @@ class Lamination:
         try:
             return curver.kernel.utilities.half(dual)
         except ValueError:
-            raise ValueError(f'Weights {a}, {b}, {c} in triangle ({i}, {j}, {k}) are not consistent') from None
+            raise ValueError(f'Weights {a}, {b}, {c} in triangle {corner} are not consistent') from None
     
     @memoize
     def left_weight(self, edge, double=False):
@@ -132,6 +136,7 @@ class Lamination:
         
         return self.dual_weight(self.triangulation.corner_lookup[edge][2], double)
     
+    @memoize
     def is_integral(self):
         ''' Return whether this lamination is integral. '''
         
@@ -264,8 +269,7 @@ class Lamination:
                     components[self.triangulation.edge_arc(edge)] = (multiplicity, edge)
             
             if self.triangulation.vertex_lookup[edge] == self.triangulation.vertex_lookup[~edge]:
-                v = self.triangulation.vertex_lookup[edge]  # = self.triangulation.vertex_lookup[~edge].
-                v_edges = curver.kernel.utilities.cyclic_slice(v, edge, ~edge)  # The set of edges that come out of v from edge round to ~edge.
+                v_edges = self.triangulation.fan(edge)  # The set of edges that come out of v from edge round to ~edge.
                 if len(v_edges) > 2:
                     around_v = curver.kernel.utilities.maximin([0], (self.left_weight(edgy) for edgy in v_edges))
                     twisting = curver.kernel.utilities.maximin([0], (self.left_weight(edgy) - around_v for edgy in v_edges[1:-1]))
@@ -335,8 +339,7 @@ class IntegralLamination(Lamination):
                 for short_lamination in short_laminations:
                     intersection += multiplicity * max(short_lamination(p), 0)
             else:  # isinstance(component, curver.kernel.Curve):
-                v = short.triangulation.vertex_lookup[p]  # = self.triangulation.vertex_lookup[~p].
-                v_edges = curver.kernel.utilities.cyclic_slice(v, p, ~p)  # The set of edges that come out of v from p round to ~p.
+                v_edges = short.triangulation.fan(p)  # The set of edges that come out of v from p round to ~p.
                 
                 for short_lamination in short_laminations:
                     around2_v = curver.kernel.utilities.maximin([0], (short_lamination.left_weight(edgy, double=True) for edgy in v_edges))
@@ -670,14 +673,17 @@ class IntegralLamination(Lamination):
             
             if isinstance(edge, curver.IntegerType): edge = curver.kernel.Edge(edge)  # If given an integer instead.
             
-            if not self.triangulation.is_flippable(edge): return 0
+            triangulation = self.triangulation
+            if not triangulation.is_flippable(edge): return 0
             
-            ad, bd, cd, dd, ed = [self.dual_weight(edgy) for edgy in self.triangulation.square(edge)]
+            a, b, _, _, e = triangulation.square(edge)
+            dual_weight = self.dual_weight
+            ed = dual_weight(e)  # Only look at the other dual weights if we need them.
             
             if ed < 0:  # Non-parallel arc.
                 return 1
             
-            if ed == 0 and ad > 0 and bd > 0:  # Bipod.
+            if ed == 0 and dual_weight(a) > 0 and dual_weight(b) > 0:  # Bipod.
                 return 0.5
             
             return 0
@@ -94,6 +94,8 @@ class Isometry(FlipGraphMove):
         # Store the inverses too while we're at it.
         self.inverse_label_map = dict((value, key) for key, value in self.label_map.items())
         self.inverse_index_map = dict((value, key) for key, value in self.index_map.items())
+        # The index of the edge of source_triangulation that maps to each edge of target_triangulation, in order.
+        self.inverse_indices = [self.inverse_index_map[index] for index in self.target_triangulation.indices]
     
     def __str__(self):
         return 'Isometry ' + str([curver.kernel.Edge(self.label_map[index]) for index in self.source_triangulation.indices])
@@ -107,7 +109,9 @@ class Isometry(FlipGraphMove):
         return self.label_map == other.label_map
     
     def apply_lamination(self, lamination):
-        geometric = [lamination(self.inverse_index_map[index]) for index in self.target_triangulation.indices]
+        # Read the weights straight out of the list rather than building an Edge for each index to look it up.
+        weights = lamination.geometric
+        geometric = [weights[index] for index in self.inverse_indices]
         return lamination.__class__(self.target_triangulation, geometric)  # Avoids promote.
     
     def apply_homology(self, homology_class):
@@ -138,6 +142,7 @@ class EdgeFlip(FlipGraphMove):
         assert self.source_triangulation.is_flippable(self.edge)
         
         self.square = self.source_triangulation.square(self.edge)
+        self.square_indices = [edge.index for edge in self.square]
     
     def __str__(self):
         return f'Flip {self.edge}'
@@ -150,44 +155,64 @@ class EdgeFlip(FlipGraphMove):
         
         return self.edge == other.edge
     
-    def apply_lamination(self, lamination):
-        ''' See Lemma 5.1.3 of [Bell15]_ for details of the cases involved in performing a flip. '''
+    def apply_geometric(self, geometric):
+        ''' Update the list of geometric weights of a lamination on source_triangulation in place so that it describes its image.
         
-        ei = lamination(self.edge)
-        ai0, bi0, ci0, di0, ei0 = [max(lamination(edge), 0) for edge in self.square]
+        See Lemma 5.1.3 of [Bell15]_ for details of the cases involved in performing a flip. '''
         
-        # Most of the new information matches the old, so we'll take a copy and modify the places that have changed.
-        geometric = list(lamination.geometric)
+        # Only the weight on the flipped edge changes and we read the others straight out of the list.
+        index = self.edge.index
+        a, b, c, d, _ = self.square_indices
+        
+        ei = geometric[index]
+        # Clamp the other weights at zero. Comparisons are much cheaper than calling max(weight, 0) four times.
+        # pylint: disable=consider-using-max-builtin
+        ai0, bi0, ci0, di0 = geometric[a], geometric[b], geometric[c], geometric[d]
+        if ai0 < 0: ai0 = 0
+        if bi0 < 0: bi0 = 0
+        if ci0 < 0: ci0 = 0
+        if di0 < 0: di0 = 0
         
         if ei >= ai0 + bi0 and ai0 >= di0 and bi0 >= ci0:  # CASE: A(ab)
-            geometric[self.edge.index] = ai0 + bi0 - ei
+            geometric[index] = ai0 + bi0 - ei
         elif ei >= ci0 + di0 and di0 >= ai0 and ci0 >= bi0:  # CASE: A(cd)
-            geometric[self.edge.index] = ci0 + di0 - ei
+            geometric[index] = ci0 + di0 - ei
         elif ei <= 0 and ai0 >= bi0 and di0 >= ci0:  # CASE: D(ad)
-            geometric[self.edge.index] = ai0 + di0 - ei
+            geometric[index] = ai0 + di0 - ei
         elif ei <= 0 and bi0 >= ai0 and ci0 >= di0:  # CASE: D(bc)
-            geometric[self.edge.index] = bi0 + ci0 - ei
+            geometric[index] = bi0 + ci0 - ei
         elif ei >= 0 and ai0 >= bi0 + ei and di0 >= ci0 + ei:  # CASE: N(ad)
-            geometric[self.edge.index] = ai0 + di0 - 2*ei
+            geometric[index] = ai0 + di0 - 2*ei
         elif ei >= 0 and bi0 >= ai0 + ei and ci0 >= di0 + ei:  # CASE: N(bc)
-            geometric[self.edge.index] = bi0 + ci0 - 2*ei
+            geometric[index] = bi0 + ci0 - 2*ei
         elif ai0 + bi0 >= ei and bi0 + ei >= 2*ci0 + ai0 and ai0 + ei >= 2*di0 + bi0:  # CASE: N(ab)
-            geometric[self.edge.index] = curver.kernel.utilities.half(ai0 + bi0 - ei)
+            geometric[index] = curver.kernel.utilities.half(ai0 + bi0 - ei)
         elif ci0 + di0 >= ei and di0 + ei >= 2*ai0 + ci0 and ci0 + ei >= 2*bi0 + di0:  # CASE: N(cd)
-            geometric[self.edge.index] = curver.kernel.utilities.half(ci0 + di0 - ei)
+            geometric[index] = curver.kernel.utilities.half(ci0 + di0 - ei)
         else:
-            geometric[self.edge.index] = max(ai0 + ci0, bi0 + di0) - ei
+            geometric[index] = max(ai0 + ci0, bi0 + di0) - ei
+    
+    def apply_lamination(self, lamination):
+        # Most of the new information matches the old, so we'll take a copy and modify the places that have changed.
+        geometric = list(lamination.geometric)
+        self.apply_geometric(geometric)
         
         return lamination.__class__(self.target_triangulation, geometric)  # Avoids promote.
     
-    def apply_homology(self, homology_class):
-        a, b, c, d, e = self.square
+    def apply_algebraic(self, algebraic):
+        ''' Update the list of algebraic weights of a homology class on source_triangulation in place so that it describes its image. '''
+        
+        a, b, _, _, e = self.square
         
-        algebraic = list(homology_class)
         # Move the homology on e onto a & b.
-        algebraic[a.index] -= a.sign() * homology_class(e)
-        algebraic[b.index] -= b.sign() * homology_class(e)
+        weight = algebraic[e.index] * e.sign()
+        algebraic[a.index] -= a.sign() * weight
+        algebraic[b.index] -= b.sign() * weight
         algebraic[e.index] = 0
+    
+    def apply_homology(self, homology_class):
+        algebraic = list(homology_class)
+        self.apply_algebraic(algebraic)
         
         return curver.kernel.HomologyClass(self.target_triangulation, algebraic)
     
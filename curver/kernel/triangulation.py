@@ -87,10 +87,11 @@ class Triangle:
         # Edges are ordered anti-clockwise. We will cyclically permute
         # these to a canonical ordering, the one where the edges are ordered
         # minimally by label.
-        best_index = min(range(3), key=lambda i: edges[i].label) if rotate is None else rotate
+        labels = [edge.label for edge in edges]
+        best_index = labels.index(min(labels)) if rotate is None else rotate
         
         self.edges = edges[best_index:] + edges[:best_index]
-        self.labels = [edge.label for edge in self]
+        self.labels = labels[best_index:] + labels[:best_index]
         self.indices = [edge.index for edge in self]
     
     def __repr__(self):
@@ -230,7 +231,8 @@ class Triangulation:
         # Triangulations are already pickleable but this results in a much smaller pickle.
         return (create_triangulation, (self.__class__,) + self.package())
     def __eq__(self, other):
-        return self.signature == other.signature
+        # Moves and encodings almost always share the same Triangulation object so check for that first.
+        return self is other or self.signature == other.signature
     def __hash__(self):
         return hash(tuple(self.signature))
     def __call__(self, geometric, promote=True):
@@ -252,6 +254,7 @@ class Triangulation:
         S = namedtuple('S', ['g', 'p', 'chi'])
         return dict((component, S((2 - v + e // 3) // 2, v, - e // 3)) for component, (v, e) in VE.items())
     
+    @memoize
     def max_order(self):
         ''' Return the maximum order of a mapping class on this surface. '''
         
@@ -356,10 +359,11 @@ class Triangulation:
         
         return np.array(M, dtype=object).transpose()  # Transpose the matrix.
     
+    @memoize
     def homology_basis(self):
         ''' Return a basis for H_1(S). '''
         
-        return [hc for hc in self.edge_homologies() if hc.is_canonical()]
+        return tuple(hc for hc in self.edge_homologies() if hc.is_canonical())
     
     def is_flippable(self, edge):
         ''' Return whether the given edge is flippable.
@@ -549,6 +553,7 @@ class Triangulation:
         
         return curver.kernel.IntegralLamination(self, [0] * self.zeta)  # Avoids promote.
     
+    @memoize
     def as_lamination(self):
         ''' Return this triangulation as a lamination. '''
         
@@ -610,7 +615,10 @@ class Triangulation:
             return self.sum(laminations)
         
         keys, values = zip(*laminations.items())  # Get list of keys (laminations) and values (multiplicities) in a paired order.
-        geometric = [sum(weight * multiplicity for weight, multiplicity in zip(weights, values)) for weights in zip(*keys)]
+        if all(multiplicity == 1 for multiplicity in values):  # Common case, such as when given an iterable, where we can skip the multiplications.
+            geometric = [sum(weights) for weights in zip(*keys)]
+        else:
+            geometric = [sum(weight * multiplicity for weight, multiplicity in zip(weights, values)) for weights in zip(*keys)]
         
         # Determine whether the disjoint sum is connected.
         is_connected = sum(laminations.values()) == 1 and all(isinstance(lamination, (curver.kernel.Curve, curver.kernel.Arc)) for lamination in laminations)
@@ -628,6 +636,16 @@ class Triangulation:
         else:  # Mixed.
             return curver.kernel.IntegralLamination(self, geometric)
     
+    @memoize
+    def fan(self, edge):
+        ''' Return the tuple of edges that come out of the vertex at the start of edge, from edge round to ~edge.
+        
+        If ~edge does not start at the same vertex then all of the edges coming out of this vertex are returned. '''
+        
+        if isinstance(edge, curver.IntegerType): edge = curver.kernel.Edge(edge)  # If given an integer instead.
+        
+        return tuple(curver.kernel.utilities.cyclic_slice(self.vertex_lookup[edge], edge, ~edge))
+    
     def edge_curve(self, edge):
         ''' Return the curve \\partial N(edge).
         
@@ -637,7 +655,7 @@ class Triangulation:
         if isinstance(edge, curver.IntegerType): edge = curver.kernel.Edge(edge)  # If given an integer instead.
         
         if self.vertex_lookup[edge] == self.vertex_lookup[~edge]:
-            edges = curver.kernel.utilities.cyclic_slice(self.vertex_lookup[edge], edge, ~edge)[1:]
+            edges = self.fan(edge)[1:]
         elif len(self.vertex_lookup[edge]) == 1:  # Folded triangle.
             edges = curver.kernel.utilities.cyclic_slice(self.vertex_lookup[~edge], ~edge)[2:-1]
         elif len(self.vertex_lookup[~edge]) == 1:  # Folded triangle.
@@ -647,6 +665,12 @@ class Triangulation:
         
         return self.curve_from_cut_sequence(edges)  # Avoids promote.
     
+    @memoize
+    def vertex_curves(self):
+        ''' Return a dictionary mapping each vertex to the peripheral Curve around it. '''
+        
+        return dict((vertex, self.curve_from_cut_sequence(vertex)) for vertex in self.vertices)
+    
     def edge_curves(self):
         ''' Return a list containing the curves generate from each edge. '''
         
@@ -659,12 +683,19 @@ class Triangulation:
         
         return curver.kernel.Arc(self, [0 if i != edge.index else -1 for i in range(self.zeta)])  # Avoids promote.
     
+    @memoize
     def edge_arcs(self):
-        ''' Return a list containing the Arc representing each Edge.
+        ''' Return a tuple containing the Arc representing each Edge.
         
         As these fill, by Alexander's trick a mapping class is the identity if and only if it fixes all of them. '''
         
-        return [self.edge_arc(edge) for edge in self.positive_edges]  # Could use self.lamination.
+        return tuple(self.edge_arc(edge) for edge in self.positive_edges)  # Could use self.lamination.
+    
+    @memoize
+    def edge_arc_boundaries(self):
+        ''' Return a tuple containing the boundary of the Arc representing each Edge. '''
+        
+        return tuple(arc.boundary() for arc in self.edge_arcs())
     
     def edge_homology(self, edge):
         ''' Return the HomologyClass of the given edge. '''
@@ -673,11 +704,12 @@ class Triangulation:
         
         return curver.kernel.HomologyClass(self, [0 if i != edge.index else edge.sign() for i in range(self.zeta)])
     
+    @memoize
     def edge_homologies(self):
-        ''' Return a list containing the HomologyClass of each Edge. '''
+        ''' Return a tuple containing the HomologyClass of each Edge. '''
         
         # Could skip those in self.dual_tree().
-        return [self.edge_homology(edge) for edge in self.positive_edges]
+        return tuple(self.edge_homology(edge) for edge in self.positive_edges)
     
     def id_isometry(self):
         ''' Return the isometry representing the identity map. '''
@@ -5,7 +5,7 @@ import numpy as np
 
 import curver
 from curver.kernel.moves import FlipGraphMove  # Special import needed for subclassing.
-from curver.kernel.decorators import ensure
+from curver.kernel.decorators import ensure, memoize
 
 class Twist(FlipGraphMove):
     ''' This represents the effect of twisting a short curve.
@@ -88,14 +88,14 @@ class Twist(FlipGraphMove):
     def apply_homology(self, homology_class):
         a = self.curve.parallel()
         
-        v = self.source_triangulation.vertex_lookup[a]  # = self.source_triangulation.vertex_lookup[~a].
-        v_edges = curver.kernel.utilities.cyclic_slice(v, a, ~a)  # The set of edges that come out of v from a round to ~a.
+        v_edges = self.source_triangulation.fan(a)  # The set of edges that come out of v from a round to ~a.
         
         algebraic = list(homology_class)
         algebraic[a.index] += a.sign() * self.power * sum(homology_class(edge) for edge in v_edges[1:])
         
         return curver.kernel.HomologyClass(self.target_triangulation, algebraic)
     
+    @memoize
     def inverse(self):
         return Twist(self.curve, -self.power)
     
@@ -121,9 +121,7 @@ class Twist(FlipGraphMove):
         # Slope calculation:
         # Get some edges.
         a = self.curve.parallel()
-        v = self.curve.triangulation.vertex_lookup[a]
-        
-        v_edges = curver.kernel.utilities.cyclic_slice(v, a, ~a)
+        v_edges = self.curve.triangulation.fan(a)
         around = curver.kernel.utilities.maximin([0], (multicurve.left_weight(edgy) for edgy in v_edges))
         around_edge = next(edge for edge in v_edges if multicurve.left_weight(edge) == around)  # The edge that realises around.
         
@@ -259,6 +257,7 @@ class HalfTwist(FlipGraphMove):
     def apply_homology(self, homology_class):
         return self.encoding_power(homology_class)
     
+    @memoize
     def inverse(self):
         return HalfTwist(self.arc, -self.power)
     
@@ -4,6 +4,8 @@
 from string import ascii_lowercase, ascii_uppercase, digits
 import re
 
+import numpy as np
+
 import curver
 
 ALPHABET = digits + ascii_lowercase + ascii_uppercase + '+-'
@@ -129,6 +131,13 @@ def product(iterable, start=1, left=True):
     
     return result
 
+def is_identity_matrix(M):
+    ''' Return whether the given square matrix is the identity matrix.
+    
+    This avoids building an identity matrix to compare against. '''
+    
+    return bool(np.count_nonzero(M) == M.shape[0] and all(M[i, i] == 1 for i in range(M.shape[0])))
+
 class Half:
     ''' A class for representing 1/2 in such a way that multiplication preserves types. '''
     def __mul__(self, other):
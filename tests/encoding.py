@@ -35,15 +35,35 @@ class TestEncoding(unittest.TestCase):
         j = data.draw(st.integers(min_value=0, max_value=len(h)))
         i, j = sorted([i, j])
         self.assertEqual(h[:i] * h[i:j] * h[j:], h)
+        with self.assertRaises(ValueError):
+            _ = h[i:j:2]
     
     @given(st.data())
     def test_package(self, data):
         h = data.draw(self._strategy())
         self.assertEqual(h, h.source_triangulation.encode(h.package()))
+    
+    @given(st.data())
+    def test_apply_laminations(self, data):
+        h = data.draw(self._strategy())
+        laminations = data.draw(st.lists(strategies.laminations(h.source_triangulation), max_size=3))
+        self.assertEqual(h.apply_laminations(laminations), tuple(h(lamination) for lamination in laminations))
 
 class TestMapping(TestEncoding):
     _strategy = staticmethod(strategies.mappings)
     
+    @given(st.data())
+    def test_apply_homologies(self, data):
+        h = data.draw(self._strategy())
+        homology_classes = data.draw(st.lists(strategies.homology_classes(h.source_triangulation), max_size=3))
+        images = []
+        for homology_class in homology_classes:
+            # Encoding.__call__ goes through apply_homologies, so apply the moves one at a time instead.
+            for move in reversed(h):
+                homology_class = move(homology_class)
+            images.append(homology_class)
+        self.assertEqual(h.apply_homologies(homology_classes), tuple(images))
+    
     @given(st.data())
     def test_homology_matrix(self, data):
         g = data.draw(self._strategy())
@@ -0,0 +1,17 @@
+
+import unittest
+
+from hypothesis import given
+import hypothesis.strategies as st
+
+from . import strategies
+
+class TestEdgeFlip(unittest.TestCase):
+    @given(st.data())
+    def test_apply_algebraic(self, data):
+        move = data.draw(strategies.edgeflips())
+        homology_class = data.draw(strategies.homology_classes(move.source_triangulation))
+        algebraic = list(homology_class)
+        move.apply_algebraic(algebraic)
+        self.assertEqual(algebraic, move(homology_class).algebraic)
+        self.assertEqual(move.inverse()(move(homology_class)), homology_class)  # Flipping back gives the same homology class.
@@ -105,6 +105,15 @@ def encodings(draw, triangulation=None, power_range=10, distribution=None):
     
     return h
 
+@st.composite
+def edgeflips(draw, triangulation=None):
+    if triangulation is None: triangulation = draw(triangulations())
+    
+    edge = draw(st.sampled_from([edge for edge in triangulation.edges if triangulation.is_flippable(edge)]))
+    [move] = triangulation.encode_flip(edge)
+    
+    return move
+
 @st.composite
 def multiarcs(draw, triangulation=None):
     if triangulation is None: triangulation = draw(triangulations())
@@ -196,6 +205,10 @@ class TestStrategiesHealth(unittest.TestCase):
     def test_encodings(self, encoding):
         self.assertIsInstance(encoding, curver.kernel.Encoding)
     
+    @given(edgeflips())
+    def test_edgeflips(self, move):
+        self.assertIsInstance(move, curver.kernel.EdgeFlip)
+    
     @given(homology_classes())
     def test_homology_classes(self, hc):
         self.assertIsInstance(hc, curver.kernel.HomologyClass)
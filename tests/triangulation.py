@@ -42,6 +42,20 @@ class TestTriangulation(unittest.TestCase):
     def test_connected(self, triangulation):
         for encoding in triangulation.all_encodings(1):
             self.assertEqual(triangulation.is_connected(), encoding.target_triangulation.is_connected())
+    
+    @given(st.data())
+    def test_fan(self, data):
+        triangulation = data.draw(strategies.triangulations())
+        edge = data.draw(st.sampled_from(triangulation.edges))
+        fan = triangulation.fan(edge)
+        self.assertEqual(fan, tuple(curver.kernel.utilities.cyclic_slice(triangulation.vertex_lookup[edge], edge, ~edge)))
+        # Walk anticlockwise around the vertex from edge until we reach ~edge or get back to edge.
+        expected = [edge]
+        while True:
+            neighbour = ~triangulation.corner_lookup[expected[-1]][2]
+            if neighbour in (edge, ~edge): break
+            expected.append(neighbour)
+        self.assertEqual(fan, tuple(expected))
 
     @given(st.integers())
     def test_norm(self, x):
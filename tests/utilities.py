@@ -7,6 +7,7 @@ import unittest
 
 from hypothesis import given, assume, settings
 import hypothesis.strategies as st
+import numpy as np
 
 import curver
 
@@ -56,6 +57,13 @@ class TestMisc(unittest.TestCase):
     def test_product(self, iterable):
         if prod is not None:
             self.assertEqual(curver.kernel.utilities.product(iterable), prod(iterable))
+    
+    @given(st.data())
+    def test_is_identity_matrix(self, data):
+        n = data.draw(st.integers(min_value=0, max_value=5))
+        M = np.array(data.draw(st.lists(st.lists(st.integers(min_value=-2, max_value=2), min_size=n, max_size=n), min_size=n, max_size=n)), dtype=object).reshape(n, n)
+        self.assertIs(curver.kernel.utilities.is_identity_matrix(M), bool(np.array_equal(M, np.identity(n, dtype=object))))
+        self.assertIs(curver.kernel.utilities.is_identity_matrix(np.identity(n, dtype=object)), True)
 
 class TestHalf(unittest.TestCase):
     ''' A class for representing 1/2 in such a way that multiplication preserves types. '''